@@ -5,11 +5,21 @@ import json
 from typing import Dict, Optional
 from .exceptions import ConfigurationError
 
+# 'hybrid' decides per page whether OCR is needed; 'document' only falls back
+# to OCR when the whole document has no embedded text.
+EXTRACTION_MODES = ('hybrid', 'document')
+
 @dataclass
 class AppConfig:
     """Application configuration settings."""
     tesseract_paths: Dict[str, str]
     temp_dir: Path
+    extraction_mode: str
+    min_text_chars: int
+    min_text_quality: float
+    ocr_dpi: int
+    render_window: int
+    max_pages_in_flight: int
     
     def __init__(self):
         self.tesseract_paths = {
@@ -17,8 +27,38 @@ class AppConfig:
             'posix': '/usr/bin/tesseract'
         }
         self.temp_dir = Path(os.getenv('TEMP_DIR', 'temp'))
+        self.extraction_mode = os.getenv('EXTRACTION_MODE', 'hybrid')
+        # Pages with fewer characters, or a lower share of alphanumerics among
+        # non-space characters, than these thresholds are sent to OCR.
+        self.min_text_chars = int(os.getenv('MIN_TEXT_CHARS', '16'))
+        self.min_text_quality = float(os.getenv('MIN_TEXT_QUALITY', '0.5'))
+        # Pages are rendered render_window at a time; at most
+        # max_pages_in_flight rendered pages are held in memory at once.
+        self.ocr_dpi = int(os.getenv('OCR_DPI', '200'))
+        self.render_window = int(os.getenv('RENDER_WINDOW', '4'))
+        self.max_pages_in_flight = int(os.getenv('MAX_PAGES_IN_FLIGHT', '8'))
         self.validate()
     
+    def validate(self) -> None:
+        """Check that configuration values are usable.
+
+        Raises:
+            ConfigurationError: If a setting is out of range or unknown
+        """
+        if self.extraction_mode not in EXTRACTION_MODES:
+            raise ConfigurationError(
+                f"Unknown extraction mode '{self.extraction_mode}', "
+                f"expected one of {', '.join(EXTRACTION_MODES)}"
+            )
+        if self.min_text_chars < 0:
+            raise ConfigurationError("min_text_chars must not be negative")
+        if not 0.0 <= self.min_text_quality <= 1.0:
+            raise ConfigurationError("min_text_quality must be between 0 and 1")
+        if self.ocr_dpi < 1:
+            raise ConfigurationError("ocr_dpi must be positive")
+        if self.render_window < 1 or self.max_pages_in_flight < 1:
+            raise ConfigurationError("render_window and max_pages_in_flight must be positive")
+
     def get_tesseract_path(self) -> Optional[str]:
         return self.tesseract_paths.get(os.name)
 
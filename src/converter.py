@@ -1,12 +1,12 @@
 from typing import Optional, Callable, List, Dict
 from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
 import pytesseract
 from PyPDF2 import PdfReader
 from pdf2image import convert_from_path
 from .exceptions import OCRError, FileAccessError
-import tempfile
-import shutil
+from .render import iter_rendered_pages
 import logging
 from concurrent.futures import ThreadPoolExecutor
 
@@ -28,6 +28,35 @@ class ConversionProgress:
     def percentage(self) -> float:
         return (self.current_page / self.total_pages) * 100
 
+class PageKind(Enum):
+    """Classification of a page's embedded text layer."""
+    TEXT = 'text'
+    EMPTY = 'empty'
+    SPARSE = 'sparse'
+
+def classify_page_text(text: str, min_chars: int, min_quality: float) -> PageKind:
+    """Decide whether a page's embedded text is usable or needs OCR.
+
+    Args:
+        text: Text extracted directly from the page
+        min_chars: Minimum number of non-whitespace characters
+        min_quality: Minimum share of alphanumeric characters among
+            non-whitespace characters; lower values indicate garbled text
+
+    Returns:
+        PageKind.TEXT if the text can be used as is, PageKind.EMPTY if the
+        page has no text layer, PageKind.SPARSE if it is too short or garbled
+    """
+    visible = [ch for ch in text if not ch.isspace()]
+    if not visible:
+        return PageKind.EMPTY
+    if len(visible) < min_chars:
+        return PageKind.SPARSE
+    alnum = sum(1 for ch in visible if ch.isalnum())
+    if alnum / len(visible) < min_quality:
+        return PageKind.SPARSE
+    return PageKind.TEXT
+
 class PDFConverter:
     """Handles PDF text extraction and OCR operations.
     
@@ -38,6 +67,7 @@ class PDFConverter:
         extract_text: Primary method for text extraction with OCR fallback
         batch_convert: Process multiple PDF files in sequence
         _extract_text_direct: Direct text extraction from PDF
+        _extract_text_hybrid: Per-page direct extraction with OCR where needed
         _extract_text_ocr: OCR-based text extraction using Tesseract
     """
     
@@ -87,10 +117,12 @@ class PDFConverter:
         try:
             with open(pdf_path, 'rb') as file:
                 reader = PdfReader(file)
-                text = self._extract_text_direct(reader, callback)
-                
-                if not text.strip():
-                    text = self._extract_text_ocr(pdf_path, callback)
+                if self.config.extraction_mode == 'hybrid':
+                    text = self._extract_text_hybrid(pdf_path, reader, callback)
+                else:
+                    text = self._extract_text_direct(reader, callback)
+                    if not text.strip():
+                        text = self._extract_text_ocr(pdf_path, callback)
                     
                 logger.info("Text extraction completed successfully")
                 return text
@@ -110,19 +142,49 @@ class PDFConverter:
                 callback(progress)
         return text
 
+    def _extract_text_hybrid(self, pdf_path: Path, reader: PdfReader, callback: Optional[Callable[[ConversionProgress], None]]) -> str:
+        """Extract embedded text per page and OCR only the pages lacking it."""
+        texts = []
+        total_pages = len(reader.pages)
+        for i, page in enumerate(reader.pages):
+            texts.append(page.extract_text() or "")
+            if callback:
+                callback(ConversionProgress(i + 1, total_pages, "Extracting text"))
+
+        ocr_pages = [
+            i + 1 for i, page_text in enumerate(texts)
+            if classify_page_text(
+                page_text, self.config.min_text_chars, self.config.min_text_quality
+            ) is not PageKind.TEXT
+        ]
+        if ocr_pages:
+            logger.info(f"OCR needed for {len(ocr_pages)} of {total_pages} pages")
+            for page_number, page_text in self._ocr_pages(pdf_path, ocr_pages, callback).items():
+                # Keep sparse embedded text when OCR finds nothing better
+                if page_text.strip():
+                    texts[page_number - 1] = page_text
+        return "\n".join(texts)
+
+    def _ocr_pages(self, pdf_path: Path, page_numbers: List[int], callback: Optional[Callable[[ConversionProgress], None]]) -> Dict[int, str]:
+        """Render and OCR selected 1-based pages through the streaming renderer."""
+        results = {}
+        for page in iter_rendered_pages(
+            pdf_path,
+            page_numbers,
+            dpi=self.config.ocr_dpi,
+            window=self.config.render_window,
+            max_in_flight=self.config.max_pages_in_flight,
+        ):
+            try:
+                results[page.page_number] = pytesseract.image_to_string(page.image)
+            finally:
+                page.release()
+            if callback:
+                callback(ConversionProgress(len(results), len(page_numbers), "OCR Processing"))
+        return results
+
     def _extract_text_ocr(self, pdf_path: Path, callback: Optional[Callable[[ConversionProgress], None]]) -> str:
-        """OCR text extraction with memory optimization."""
-        text = []
-        with tempfile.TemporaryDirectory() as temp_dir:
-            images = convert_from_path(
-                pdf_path,
-                output_folder=temp_dir,
-                fmt='jpeg',
-                thread_count=2
-            )
-            for i, image in enumerate(images):
-                text.append(pytesseract.image_to_string(image))
-                image.close()  # Release memory
-                if callback:
-                    callback(ConversionProgress(i + 1, len(images), "OCR Processing"))
-        return "\n".join(text)
+        """OCR every page, streaming rendered pages in bounded windows."""
+        total_pages = len(PdfReader(str(pdf_path)).pages)
+        results = self._ocr_pages(pdf_path, list(range(1, total_pages + 1)), callback)
+        return "\n".join(results[n] for n in sorted(results))
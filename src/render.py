@@ -0,0 +1,140 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+from pdf2image import convert_from_path
+from PIL import Image
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+def _page_ranges(page_numbers: List[int]) -> List[Tuple[int, int]]:
+    """Collapse sorted 1-based page numbers into inclusive (first, last) runs."""
+    ranges: List[Tuple[int, int]] = []
+    for number in page_numbers:
+        if ranges and ranges[-1][1] == number - 1:
+            ranges[-1] = (ranges[-1][0], number)
+        else:
+            ranges.append((number, number))
+    return ranges
+
+def render_windows(page_numbers: List[int], window: int) -> List[Tuple[int, int]]:
+    """Split pages into contiguous (first, last) runs of at most ``window`` pages."""
+    windows = []
+    for first, last in _page_ranges(page_numbers):
+        for start in range(first, last + 1, window):
+            windows.append((start, min(start + window - 1, last)))
+    return windows
+
+@dataclass
+class RenderedPage:
+    """A rendered page image backed by a temporary file.
+
+    Call ``release`` as soon as the page has been processed so that the image
+    and its file are freed and the renderer may start on further pages.
+    """
+    page_number: int
+    image: Image.Image
+    path: Optional[Path] = None
+    _slots: Optional[threading.Semaphore] = field(default=None, repr=False)
+
+    def release(self) -> None:
+        if self._slots is None:
+            return
+        self.image.close()
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+        self._slots.release()
+        self._slots = None
+
+def iter_rendered_pages(
+    pdf_path: Path,
+    page_numbers: List[int],
+    dpi: int = 200,
+    window: int = 4,
+    max_in_flight: int = 8,
+    thread_count: int = 2,
+) -> Iterator[RenderedPage]:
+    """Render pages in small windows on a background thread.
+
+    Pages are yielded in order as soon as their window has been rendered, so
+    OCR of one window overlaps with rendering of the next. At most
+    ``max_in_flight`` rendered pages exist at any time; a slot is returned
+    when the consumer calls ``RenderedPage.release``.
+
+    Args:
+        pdf_path: Path to PDF file
+        page_numbers: Sorted 1-based page numbers to render
+        dpi: Render resolution
+        window: Maximum pages per pdftoppm invocation
+        max_in_flight: Maximum rendered pages held at once
+        thread_count: pdftoppm processes per window
+
+    Yields:
+        RenderedPage objects in page order
+    """
+    window = max(1, min(window, max_in_flight))
+    slots = threading.Semaphore(max_in_flight)
+    pages: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    temp_dir = tempfile.mkdtemp(prefix='pdf2wrd_render_')
+
+    def acquire(count: int) -> int:
+        acquired = 0
+        while acquired < count:
+            if stop.is_set():
+                break
+            if slots.acquire(timeout=0.1):
+                acquired += 1
+        return acquired
+
+    def produce() -> None:
+        try:
+            for first, last in render_windows(page_numbers, window):
+                count = last - first + 1
+                if acquire(count) < count:
+                    return
+                images = convert_from_path(
+                    pdf_path,
+                    dpi=dpi,
+                    output_folder=temp_dir,
+                    first_page=first,
+                    last_page=last,
+                    fmt='jpeg',
+                    thread_count=thread_count
+                )
+                for page_number, image in zip(range(first, last + 1), images):
+                    path = Path(image.filename) if getattr(image, 'filename', None) else None
+                    pages.put(RenderedPage(page_number, image, path, slots))
+        except Exception as e:
+            pages.put(e)
+        finally:
+            pages.put(_DONE)
+
+    producer = threading.Thread(target=produce, name='pdf-render', daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+        while not pages.empty():
+            item = pages.get_nowait()
+            if isinstance(item, RenderedPage):
+                item.release()
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -14,4 +14,55 @@ def converter(config):
 
 @pytest.fixture
 def sample_pdf():
-    return Path('tests/samples/sample.pdf')
\ No newline at end of file
+    return Path('tests/samples/sample.pdf')
+
+def _write_text_pdf(path: Path, pages) -> Path:
+    """Write a minimal PDF with one Helvetica text line per page.
+
+    Pages given as None are left without any content stream, like a scan
+    without a text layer.
+    """
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        page_id = len(objects) + 1
+        kids.append(f"{page_id} 0 R")
+        if text is None:
+            objects.append(
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>"
+            )
+            continue
+        escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        stream = f"BT /F1 12 Tf 72 720 Td ({escaped}) Tj ET".encode("latin-1")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+            .encode()
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref
+    )
+    path.write_bytes(bytes(out))
+    return path
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """Factory writing a PDF whose pages carry the given text (None = no text)."""
+    def _make(pages, name="generated.pdf"):
+        return _write_text_pdf(tmp_path / name, pages)
+    return _make
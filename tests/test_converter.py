@@ -1,6 +1,6 @@
 import pytest
 from pathlib import Path
-from src.converter import PDFConverter
+from src.converter import PDFConverter, PageKind, classify_page_text
 from src.config import AppConfig
 from src.exceptions import OCRError, FileAccessError
 
@@ -51,3 +51,28 @@ def test_batch_conversion(converter, sample_pdf, scanned_pdf):
     results = converter.batch_convert([sample_pdf, scanned_pdf])
     assert len(results) == 2
     assert all(isinstance(r, str) for r in results)
+
+def test_classify_page_text():
+    assert classify_page_text("", 16, 0.5) is PageKind.EMPTY
+    assert classify_page_text("  \n ", 16, 0.5) is PageKind.EMPTY
+    assert classify_page_text("Exhibit A", 16, 0.5) is PageKind.SPARSE
+    assert classify_page_text("\x01#%&*@!~^#%&*@!~^ ab", 16, 0.5) is PageKind.SPARSE
+    assert classify_page_text("This agreement is made between", 16, 0.5) is PageKind.TEXT
+
+def test_hybrid_ocrs_only_pages_without_text(converter, make_pdf, monkeypatch):
+    pdf = make_pdf(["This contract page has plenty of embedded text", None,
+                    "Another born-digital page with enough text"])
+    requested = []
+    def fake_ocr_pages(pdf_path, page_numbers, callback):
+        requested.extend(page_numbers)
+        return {n: f"scanned page {n}" for n in page_numbers}
+    monkeypatch.setattr(converter, "_ocr_pages", fake_ocr_pages)
+
+    text = converter.extract_text(pdf)
+
+    assert requested == [2]
+    assert text.split("\n") == [
+        "This contract page has plenty of embedded text",
+        "scanned page 2",
+        "Another born-digital page with enough text",
+    ]
@@ -0,0 +1,62 @@
+import threading
+from pathlib import Path
+from PIL import Image
+import pytest
+import src.render as render
+from src.render import _page_ranges, render_windows, iter_rendered_pages
+
+def _fake_convert(calls, lock=None):
+    def convert_from_path(pdf_path, dpi, output_folder, first_page, last_page, **kwargs):
+        calls.append((first_page, last_page))
+        images = []
+        for n in range(first_page, last_page + 1):
+            path = Path(output_folder) / f"page-{n}.jpg"
+            Image.new("L", (8, 8), 255).save(path)
+            images.append(Image.open(path))
+        return images
+    return convert_from_path
+
+def test_page_ranges():
+    assert _page_ranges([]) == []
+    assert _page_ranges([2, 3, 4, 7, 9, 10]) == [(2, 4), (7, 7), (9, 10)]
+
+def test_render_windows_split_long_runs():
+    assert render_windows([1, 2, 3, 4, 5, 9], 2) == [(1, 2), (3, 4), (5, 5), (9, 9)]
+
+def test_pages_stream_in_order_and_files_are_freed(monkeypatch):
+    calls = []
+    monkeypatch.setattr(render, "convert_from_path", _fake_convert(calls))
+    seen = []
+    for page in iter_rendered_pages(Path("doc.pdf"), [1, 2, 3, 5], window=2, max_in_flight=2):
+        assert page.path.exists()
+        seen.append(page.page_number)
+        page.release()
+        assert not page.path.exists()
+    assert seen == [1, 2, 3, 5]
+    assert calls == [(1, 2), (3, 3), (5, 5)]
+
+def test_in_flight_pages_are_bounded(monkeypatch):
+    monkeypatch.setattr(render, "convert_from_path", _fake_convert([]))
+    held = []
+    stream = iter_rendered_pages(Path("doc.pdf"), list(range(1, 11)), window=4, max_in_flight=3)
+    held.append(next(stream))
+    held.append(next(stream))
+    held.append(next(stream))
+    # The fourth page cannot be rendered until a slot is released
+    waiter = threading.Thread(target=lambda: held.append(next(stream)))
+    waiter.start()
+    waiter.join(timeout=0.3)
+    assert waiter.is_alive()
+    held[0].release()
+    waiter.join(timeout=2)
+    assert [p.page_number for p in held] == [1, 2, 3, 4]
+    for page in held:
+        page.release()
+    stream.close()
+
+def test_render_errors_propagate(monkeypatch):
+    def broken(*args, **kwargs):
+        raise RuntimeError("pdftoppm failed")
+    monkeypatch.setattr(render, "convert_from_path", broken)
+    with pytest.raises(RuntimeError):
+        list(iter_rendered_pages(Path("doc.pdf"), [1]))